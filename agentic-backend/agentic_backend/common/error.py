@@ -45,6 +45,9 @@ class MCPToolFetchError(ValueError): ...
 class NoToolkitProvidedError(ValueError): ...
 
 
+class InvalidAgentClassError(TypeError): ...
+
+
 # ------------------------------
 # Session storage exceptions
 # ------------------------------
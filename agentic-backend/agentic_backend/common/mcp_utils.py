@@ -32,6 +32,7 @@ Contract
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from datetime import timedelta
@@ -47,7 +48,7 @@ from agentic_backend.core.agents.runtime_context import RuntimeContext
 logger = logging.getLogger(__name__)
 
 # ✅ Only allow transports that Fred knows how to configure safely.
-SUPPORTED_TRANSPORTS = ["sse", "stdio", "streamable_http", "websocket"]
+SUPPORTED_TRANSPORTS = frozenset({"sse", "stdio", "streamable_http", "websocket"})
 
 
 class MCPConnectionError(Exception):
@@ -200,10 +201,10 @@ async def get_connected_mcp_client_for_agent(
 
     client = MultiServerMCPClient(connections)
 
-    # Validate connections by attempting to load tools per server
-    exceptions: list[Exception] = []
-    total_tools = 0
-    for server in mcp_servers:
+    # Validate connections by attempting to load tools per server.
+    # Servers are independent: probe them concurrently so setup costs max(latency).
+    async def _validate(server: MCPServerConfiguration) -> tuple[int, list]:
+        """Return (tool count, connection errors) for one server."""
         conn_entry = connections.get(server.name) or {}
         url_for_log = conn_entry.get("url", "")
         auth_label = _mask_auth_value(
@@ -228,7 +229,7 @@ async def get_connected_mcp_client_for_agent(
                 len(tools),
                 dur_ms,
             )
-            total_tools += len(tools)
+            return len(tools), []
         except BaseException as e:
             dur_ms = (time.perf_counter() - start) * 1000
             logger.warning(
@@ -240,7 +241,12 @@ async def get_connected_mcp_client_for_agent(
                 dur_ms,
                 str(e).split("\n")[0],
             )
-            exceptions.extend(getattr(e, "exceptions", [e]))
+            return 0, list(getattr(e, "exceptions", [e]))
+
+    results = await asyncio.gather(*(_validate(server) for server in mcp_servers))
+    total_tools = sum(count for count, _ in results)
+    # Keep errors in server declaration order
+    exceptions: list[Exception] = [exc for _, errs in results for exc in errs]
 
     if exceptions:
         logger.error("MCP summary: %d server(s) failed to connect.", len(exceptions))
@@ -79,7 +79,7 @@ class BaseAgent(BaseModel):
     enabled: bool = True
     class_path: Optional[str] = None  # None → dynamic/UI agent
     tuning: Optional[AgentTuning] = None
-    chat_options: AgentChatOptions = AgentChatOptions()
+    chat_options: AgentChatOptions = Field(default_factory=AgentChatOptions)
     # Added for backward compatibility with older YAML files
     mcp_servers: List[MCPServerConfiguration] = Field(
         default_factory=list,
@@ -26,6 +26,12 @@ from agentic_backend.common.structures import (
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it (same safe semantics, much faster)
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
 
 def parse_server_configuration(configuration_path: str) -> Configuration:
     """
@@ -37,9 +43,10 @@ def parse_server_configuration(configuration_path: str) -> Configuration:
     Returns:
         Configuration: The parsed configuration object.
     """
+    logger.debug("Parsing configuration with %s", _YamlSafeLoader.__name__)
     with open(configuration_path, "r") as f:
         try:
-            config: Dict = yaml.safe_load(f)
+            config: Dict = yaml.load(f, Loader=_YamlSafeLoader)
         except yaml.YAMLError as e:
             print(f"Error while parsing configuration file {configuration_path}: {e}")
             exit(1)
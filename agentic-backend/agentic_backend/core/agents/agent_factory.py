@@ -28,6 +28,9 @@ from agentic_backend.core.leader.leader_flow import LeaderFlow
 
 logger = logging.getLogger(__name__)
 
+# Max crew experts initializing at once (bounds concurrent MCP connects per leader)
+_CREW_INIT_CONCURRENCY = 8
+
 
 class BaseAgentFactory:
     @abstractmethod
@@ -140,11 +143,7 @@ class AgentFactory(BaseAgentFactory):
         settings = self.manager.get_agent_settings(agent_name)
         if not settings:
             raise ValueError(f"Agent '{agent_name}' not found in catalog.")
-        if not settings.class_path:
-            raise ValueError(f"Agent '{agent_name}' has no class_path defined.")
-        agent_cls = self.loader._import_agent_class(settings.class_path)
-        agent = cast(AgentFlow, agent_cls(agent_settings=settings))
-        return settings, agent
+        return settings, self.loader._instantiate(settings)
 
     async def _initialize_agent(
         self,
@@ -169,10 +168,9 @@ class AgentFactory(BaseAgentFactory):
             await agent.async_init(runtime_context, crew)
             return
 
-        # Simple agent
-        if hasattr(agent, "async_init"):
-            logger.info("[AGENTS] agent='%s' async_init invoked.", agent.get_name())
-            await agent.async_init(runtime_context=runtime_context)
+        # Simple agent (async_init is defined on AgentFlow, so always present)
+        logger.info("[AGENTS] agent='%s' async_init invoked.", agent.get_name())
+        await agent.async_init(runtime_context=runtime_context)
 
     async def _build_leader_crew(
         self,
@@ -182,18 +180,38 @@ class AgentFactory(BaseAgentFactory):
         """
         Why: leaders orchestrate expert agents. We build each expert exactly like a simple agent:
         instantiate → apply settings → set context → async_init — then hand to the Leader.
+        Experts are independent, so their (I/O bound) async_init calls run concurrently.
+        If any of them fails, the ones already initialized are closed and the first
+        error is raised.
         """
         crew: Dict[str, AgentFlow] = {}
         for expert_name in leader_settings.crew:
             expert_settings, expert = self._instantiate_from_settings(expert_name)
             expert.apply_settings(expert_settings)
             expert.set_runtime_context(runtime_context)
-            if hasattr(expert, "async_init"):
+            crew[expert_name] = expert
+
+        sem = asyncio.Semaphore(_CREW_INIT_CONCURRENCY)
+
+        async def _init_expert(expert: AgentFlow) -> None:
+            async with sem:
                 logger.info(
                     "[AGENTS] expert='%s' async_init invoked.", expert.get_name()
                 )
                 await expert.async_init(runtime_context=runtime_context)
-            crew[expert_name] = expert
+
+        results = await asyncio.gather(
+            *(_init_expert(expert) for expert in crew.values()),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            # Close the experts that did come up (MCP connections), sequentially as
+            # in teardown_session_agents, before surfacing the first failure.
+            for (expert_name, expert), result in zip(crew.items(), results):
+                if result is None:
+                    await self._execute_aclose(expert, ("", expert_name))
+            raise errors[0]
         return crew
 
     async def teardown_session_agents(self, session_id: str) -> None:
@@ -220,11 +238,13 @@ class AgentFactory(BaseAgentFactory):
         try:
             # Calls Tessa.aclose() -> MCPRuntime.aclose() -> AsyncExitStack.aclose()
             await agent.aclose()
-            logger.debug(f"[AGENTS] Agent '{agent_name}' closed successfully.")
+            logger.debug("[AGENTS] Agent '%s' closed successfully.", agent_name)
         except Exception:
             # Log the failure but ensure the task completes
             logger.error(
-                f"[AGENTS] Failed to close agent '{agent_name}' for session '{session_id}'.",
+                "[AGENTS] Failed to close agent '%s' for session '%s'.",
+                agent_name,
+                session_id,
                 exc_info=True,
             )
 
@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextlib
 import logging
 import math
+import string
 import sys
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from importlib.resources import files
 from pathlib import Path
 from typing import (
@@ -28,6 +32,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     cast,
 )
 
@@ -38,6 +43,7 @@ from langchain_core.messages import (
     BaseMessage,
     HumanMessage,
     SystemMessage,
+    ToolMessage,
 )
 from langchain_core.runnables import Runnable, RunnableConfig
 
@@ -73,12 +79,58 @@ from agentic_backend.core.agents.runtime_context import RuntimeContext
 
 logger = logging.getLogger(__name__)
 
+# Max graph updates buffered ahead of the consumer in astream_updates()
+_STREAM_PREFETCH = 8
+_STREAM_END = object()
+
+# Message classes returned as-is by ensure_any_message() without walking the MRO.
+_CONCRETE_MESSAGE_TYPES = frozenset(
+    {AIMessage, HumanMessage, SystemMessage, ToolMessage}
+)
+
 
 class _SafeDict(dict):
     def __missing__(self, key):  # keep unknown tokens literal: {key}
         return "{" + key + "}"
 
 
+@lru_cache(maxsize=256)
+def _read_bundled_text(module_name: str, filename: str) -> str:
+    """
+    Read a text file shipped next to an agent module.
+    Bundled files never change during the process lifetime, so each one is read once.
+    Failures are not cached (lru_cache does not memoize exceptions).
+    """
+    resource_path = files(sys.modules[module_name]).joinpath(filename)
+    return resource_path.read_text(encoding="utf-8")
+
+
+_FORMATTER = string.Formatter()
+
+
+@lru_cache(maxsize=256)
+def _template_fields(template: str) -> Optional[frozenset[str]]:
+    """
+    Root names of the `{token}` placeholders of a prompt template (parsed once per template).
+    Returns None when a plain `format_map` can't be trusted to behave like the `_SafeDict`
+    path (positional or nested fields, malformed braces), so render() keeps the safe path.
+    """
+    names: set[str] = set()
+    try:
+        for _, field, spec, _ in _FORMATTER.parse(template):
+            if field is None:
+                continue
+            if spec and "{" in spec:
+                return None
+            root = field.partition(".")[0].partition("[")[0]
+            if not root or root.isdigit():
+                return None
+            names.add(root)
+    except ValueError:
+        return None
+    return frozenset(names)
+
+
 class AgentFlow:
     """
     Base class for LangGraph-based AI agents.
@@ -102,8 +154,25 @@ class AgentFlow:
     tuning: ClassVar[AgentTuning]
     default_chat_options: ClassVar[Optional[AgentChatOptions]] = None
 
+    # Base attributes live in slots. "__dict__" is kept so subclasses can still add
+    # their own attributes (model, mcp, toolkit, ...) without declaring __slots__.
+    __slots__ = (
+        "agent_settings",
+        "_tuning",
+        "current_date",
+        "_graph",
+        "streaming_memory",
+        "compiled_graph",
+        "_prepared_cache",
+        "run_config",
+        "runtime_context",
+        "asset_client",
+        "__dict__",
+        "__weakref__",
+    )
+
     _tuning: AgentTuning
-    run_config: RunnableConfig = {}  # Use an empty dict as the default/initial value
+    run_config: RunnableConfig
 
     def __init__(self, agent_settings: AgentSettings):
         """
@@ -122,10 +191,13 @@ class AgentFlow:
                 - tag:s (Optional) Short tag identifier for the agent.
         """
         self.apply_settings(agent_settings)
+        self.run_config = {}  # Empty until astream_updates() receives the run config
         self.current_date = datetime.now().strftime("%Y-%m-%d")
         self._graph = None  # Will be built in async_init
         self.streaming_memory = MemorySaver()
         self.compiled_graph: Optional[CompiledStateGraph] = None
+        # (runtime_context, prepared) of the last resolve_prepared() call, see _get_prepared()
+        self._prepared_cache: Optional[Tuple[RuntimeContext, Prepared]] = None
         # has_public_key = os.getenv("LANGFUSE_PUBLIC_KEY") is not None
         # has_secret_key = os.getenv("LANGFUSE_SECRET_KEY") is not None
 
@@ -140,6 +212,11 @@ class AgentFlow:
         """
         Compile and return the agent's graph (idempotent).
         Subclasses must set `self._graph` in async_init().
+
+        The compiled graph is cached per instance, never per class: graph nodes are
+        bound methods of this instance (e.g. `self.reasoner`, bound tools/model) and
+        the checkpointer (`self.streaming_memory`) is baked in at compile time, so two
+        agents with identical topologies still cannot share one compiled graph.
         """
         if self.compiled_graph is not None:
             return self.compiled_graph
@@ -158,9 +235,11 @@ class AgentFlow:
         """
         self.agent_settings = new_settings.model_copy(deep=True)
         # Use the resolved tuning from Manager; if missing, allow class-level as a hard fallback.
-        self._tuning = self.agent_settings.tuning or type(self).tuning
-        # Keep .tuning coherent on the settings object held by the instance
-        self.agent_settings.tuning = self._tuning
+        tuning = self.agent_settings.tuning
+        if tuning is None:
+            # Keep .tuning coherent on the settings object held by the instance
+            tuning = self.agent_settings.tuning = type(self).tuning
+        self._tuning = tuning
 
     async def async_init(self, runtime_context: RuntimeContext):
         """
@@ -279,14 +358,49 @@ class AgentFlow:
         #         self.get_name(),
         #     )
 
-        # 5. Execute the graph using the MODIFIED config (self.run_config)
-        async for event in compiled.astream(
-            state,
-            config=self.run_config,  # <--- CORRECT: Pass the updated config
-            stream_mode="updates",
-            **kwargs,
-        ):
-            yield event
+        # 5. Execute the graph using the MODIFIED config (self.run_config).
+        # The graph runs in a producer task feeding a bounded queue, so it can compute
+        # the next update while the caller is still sending the previous one to the
+        # client. The bound keeps backpressure: a slow consumer pauses the graph.
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_STREAM_PREFETCH)
+        # Set once the consumer is gone: nobody reads the queue anymore
+        stopping = False
+
+        async def _produce() -> None:
+            terminal: Any = _STREAM_END
+            try:
+                async for event in compiled.astream(
+                    state,
+                    config=self.run_config,  # <--- CORRECT: Pass the updated config
+                    stream_mode="updates",
+                    **kwargs,
+                ):
+                    await queue.put(event)
+            except BaseException as e:
+                # Not only Exception: a CancelledError from an MCP cancel scope or a
+                # BaseExceptionGroup must reach the consumer too, or it waits forever.
+                if stopping:
+                    raise
+                terminal = e
+            # Always end the stream: _STREAM_END or the failure, re-raised by the consumer
+            await queue.put(terminal)
+
+        producer = asyncio.create_task(_produce(), name=f"astream[{self.get_name()}]")
+        try:
+            while True:
+                item = await queue.get()
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Consumer stopped early (client gone, error): stop the graph as well
+            if not producer.done():
+                stopping = True
+                producer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await producer
 
         # 6. Flush the client after the run is complete
         # if self.langfuse_client is not None:
@@ -310,6 +424,9 @@ class AgentFlow:
         - str         -> AIMessage(content=str)
         - other       -> AIMessage(content=repr(other))
         """
+        # Fast path: model outputs are almost always one of the concrete message classes.
+        if type(msg) in _CONCRETE_MESSAGE_TYPES:
+            return cast(AnyMessage, msg)
         if isinstance(msg, BaseMessage):
             return cast(AnyMessage, msg)
         if isinstance(msg, str):
@@ -388,7 +505,9 @@ class AgentFlow:
         """
         # self.run_config is available when the node is executed
         # It contains the 'configurable' dict passed during astream()
-        user_id = self.run_config.get("configurable", {}).get("user_id")
+        cfg = self.run_config
+        conf = cfg.get("configurable") if cfg else None
+        user_id = conf.get("user_id") if conf else None
 
         if not user_id:
             # IMPORTANT: Raise an error if the user ID is mandatory for asset operations
@@ -466,12 +585,8 @@ class AgentFlow:
         agent_module_name = self.__module__
 
         try:
-            # Get a Traversable object pointing to the file path
-            resource_path = files(sys.modules[agent_module_name]).joinpath(filename)
-
-            # Read the file content as text
-            content = resource_path.read_text(encoding="utf-8")
-            return content
+            # Read once per (module, filename); later calls are served from memory
+            return _read_bundled_text(agent_module_name, filename)
 
         except FileNotFoundError:
             error_msg = (
@@ -500,11 +615,11 @@ class AgentFlow:
                 self.asset_client.fetch_asset_content_text, agent_name, asset_key
             )
         except AssetRetrievalError as e:
-            logger.error(f"Failed to fetch asset for agent: {e}")
+            logger.error("Failed to fetch asset for agent: %s", e)
             # Re-raise the error, or return a default/fail state
             return f"[Asset Retrieval Error: {e.args[0]}]"
         except Exception as e:
-            logger.error(f"Unexpected error fetching asset for agent: {e}")
+            logger.error("Unexpected error fetching asset for agent: %s", e)
             raise
 
     async def fetch_asset_blob(self, asset_key: str) -> AssetBlob:
@@ -518,10 +633,10 @@ class AgentFlow:
                 self.asset_client.fetch_asset_blob, agent_name, asset_key
             )
         except AssetRetrievalError as e:
-            logger.error(f"Failed to fetch asset for agent: {e}")
+            logger.error("Failed to fetch asset for agent: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching asset for agent: {e}")
+            logger.error("Unexpected error fetching asset for agent: %s", e)
             raise
 
     async def fetch_asset_blob_to_tempfile(
@@ -581,10 +696,10 @@ class AgentFlow:
             )
             return result
         except AssetUploadError as e:
-            logger.error(f"Failed to upload user asset: {e}")
+            logger.error("Failed to upload user asset: %s", e)
             raise  # Re-raise the specific error
         except Exception as e:
-            logger.error(f"Unexpected error during user asset upload: {e}")
+            logger.error("Unexpected error during user asset upload: %s", e)
             raise
 
     def get_asset_download_url(self, asset_key: str, scope: str = "user") -> str:
@@ -613,17 +728,19 @@ class AgentFlow:
         This avoids ugly inline casts in agent logic.
         """
         content = message.content
-        if isinstance(content, str):
+        # Exact type check first: plain str is by far the common case
+        if type(content) is str or isinstance(content, str):
             return content
 
         # Handle cases where content is None or a complex structure
         if content is None:
             return ""
 
-        logger.warning(
-            "Model response content was type %s, expected str. Returning empty string.",
-            type(content).__name__,
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Model response content was type %s, expected str. Returning empty string.",
+                type(content).__name__,
+            )
         return ""
 
     def get_settings(self) -> AgentSettings:
@@ -642,13 +759,29 @@ class AgentFlow:
         - If your agent ignores chat context, simply don't call this method.
         """
         ctx = self.get_runtime_context() or RuntimeContext()
-        prepared: Prepared = resolve_prepared(ctx, get_knowledge_flow_base_url())
+        prepared = self._get_prepared(ctx)
         base = (prepared.prompt_chat_context_text or "").strip()
         # Optionally augment with per-turn attachments markdown injected by the chat layer
         if ctx.attachments_markdown is not None:
             base += ("\n\n" if base else "") + ctx.attachments_markdown.strip()
         return base
 
+    def _get_prepared(self, ctx: RuntimeContext) -> Prepared:
+        """
+        Resolve the prepared chat context once per runtime context.
+
+        `resolve_prepared` fetches every selected chat-context resource over HTTP, and
+        nodes may ask for the chat context several times within a single turn. The
+        result is reused as long as the same RuntimeContext object is in place;
+        `set_runtime_context` drops it at the start of each new turn.
+        """
+        cached = self._prepared_cache
+        if cached is not None and cached[0] is ctx:
+            return cached[1]
+        prepared = resolve_prepared(ctx, get_knowledge_flow_base_url())
+        self._prepared_cache = (ctx, prepared)
+        return prepared
+
     def render(self, template: str, **tokens) -> str:
         """
         Safe `{token}` substitution for prompt templates.
@@ -663,7 +796,12 @@ class AgentFlow:
         """
         base = {"today": self.current_date}
         base.update(tokens or {})
-        return (template or "").format_map(_SafeDict(base)).strip()
+        template = template or ""
+        fields = _template_fields(template)
+        if fields is not None and fields <= base.keys():
+            # Every placeholder is provided: plain dict, no per-key __missing__ fallback
+            return template.format_map(base).strip()
+        return template.format_map(_SafeDict(base)).strip()
 
     def get_tuned_text(self, key: str) -> Optional[str]:
         """
@@ -712,16 +850,22 @@ class AgentFlow:
         - Force the system to take it into account.
 
         """
-        messages = [msg for msg in messages if not isinstance(msg, ChatContextMessage)]
         chat_context = self.chat_context_text()
-        if not chat_context:
-            return list(messages)
-        messages.append(ChatContextMessage(content=chat_context))
-        return messages
+        # Most turns carry no stale ChatContextMessage: only filter when one is present.
+        if any(isinstance(msg, ChatContextMessage) for msg in messages):
+            out = [msg for msg in messages if not isinstance(msg, ChatContextMessage)]
+        else:
+            out = list(messages)
+        if chat_context:
+            out.append(ChatContextMessage(content=chat_context))
+        return out
 
     def set_runtime_context(self, context: RuntimeContext) -> None:
         """Set the runtime context for this agent."""
+        if getattr(self, "runtime_context", None) is context:
+            return  # same context re-applied on cached agent reuse: keep _prepared_cache
         self.runtime_context = context
+        self._prepared_cache = None
 
     def get_runtime_context(self) -> Optional[RuntimeContext]:
         """Get the current runtime context."""
@@ -792,15 +936,21 @@ class AgentFlow:
                 spec_min = fs.min
                 spec_max = fs.max
 
-        lo = min_value if min_value is not None else spec_min
-        hi = max_value if max_value is not None else spec_max
+        # unbounded sides fall back to ±inf so the clamp is a single expression
+        lo = (
+            min_value
+            if min_value is not None
+            else (spec_min if spec_min is not None else -math.inf)
+        )
+        hi = (
+            max_value
+            if max_value is not None
+            else (spec_max if spec_max is not None else math.inf)
+        )
 
-        # clamp
+        # clamp (argument order keeps NaN untouched, as the former if-chain did)
         if val is not None:
-            if lo is not None and val < lo:
-                val = lo
-            if hi is not None and val > hi:
-                val = hi
+            val = min(max(val, lo), hi)
 
         return val
 
@@ -16,9 +16,11 @@ from __future__ import annotations
 
 import importlib
 import logging
-from typing import List, Type
+from typing import Dict, List, Type
 
+from agentic_backend.common.error import InvalidAgentClassError
 from agentic_backend.common.structures import (
+    AgentSettings,
     Configuration,
 )
 from agentic_backend.core.agents.agent_flow import AgentFlow
@@ -26,6 +28,10 @@ from agentic_backend.core.agents.store.base_agent_store import BaseAgentStore
 
 logger = logging.getLogger(__name__)
 
+# class_path -> resolved class. Classes do not change during the process lifetime,
+# so each dotted path is imported once (static, persisted and factory lookups alike).
+_CLASS_CACHE: Dict[str, Type[AgentFlow]] = {}
+
 
 class AgentLoader:
     """
@@ -63,16 +69,11 @@ class AgentLoader:
                 )
                 continue
             try:
-                cls = self._import_agent_class(agent_cfg.class_path)
-                if not issubclass(cls, AgentFlow):
-                    logger.error(
-                        "Class '%s' is not AgentFlow for '%s'",
-                        agent_cfg.class_path,
-                        agent_cfg.name,
-                    )
-                    continue
-                inst: AgentFlow = cls(agent_settings=agent_cfg)
-                instances.append(inst)
+                instances.append(self._instantiate(agent_cfg))
+            except InvalidAgentClassError as e:
+                logger.error(
+                    "Invalid class for static agent '%s': %s", agent_cfg.name, e
+                )
             except Exception as e:
                 logger.exception(
                     "❌ Failed to construct static agent '%s': %s", agent_cfg.name, e
@@ -95,22 +96,14 @@ class AgentLoader:
                 continue
 
             try:
-                cls = self._import_agent_class(agent_settings.class_path)
-                if not issubclass(cls, AgentFlow):
-                    logger.error(
-                        "agent=%s class=%s is not AgentFlow",
-                        agent_settings.name,
-                        agent_settings.class_path,
-                    )
-                    continue
-
+                out.append(self._instantiate(agent_settings))
                 logger.debug(
                     "agent=%s class=%s loaded",
                     agent_settings.name,
                     agent_settings.class_path,
                 )
-                inst: AgentFlow = cls(agent_settings=agent_settings)
-                out.append(inst)
+            except InvalidAgentClassError as e:
+                logger.error("agent=%s %s", agent_settings.name, e)
             except ModuleNotFoundError:
                 logger.error(
                     "agent=%s Failed to load persisted agent (ModuleNotFoundError). Removing stale entry from store.",
@@ -136,16 +129,38 @@ class AgentLoader:
 
         return out
 
+    def _instantiate(self, settings: AgentSettings) -> AgentFlow:
+        """
+        Resolve, validate and construct the agent class named by `settings.class_path`.
+        Single construction path for the loaders and the factory; raises like
+        `_import_agent_class` (ImportError / InvalidAgentClassError) or the agent
+        constructor.
+        """
+        if not settings.class_path:
+            raise ValueError(f"Agent '{settings.name}' has no class_path defined.")
+        cls = self._import_agent_class(settings.class_path)
+        return cls(agent_settings=settings)
+
     def _import_agent_class(self, class_path: str) -> Type[AgentFlow]:
         """
         Dynamically import an agent class from its full class path.
-        Raises ImportError if the class cannot be found.
+        Raises ImportError if the class cannot be found, InvalidAgentClassError if
+        it is not an AgentFlow. Only validated classes are cached.
 
-        This method is only used to check class validity during loading;
-        actual instantiation is done elsewhere.
+        Instantiation happens in `_instantiate`, so errors raised by an agent
+        constructor are never mistaken for an invalid class_path.
         """
+        cls = _CLASS_CACHE.get(class_path)
+        if cls is not None:
+            return cls
         module_name, class_name = class_path.rsplit(".", 1)
+        # import_module already short-circuits on loaded modules and, unlike a bare
+        # sys.modules lookup, waits for a module another thread is still importing.
         module = importlib.import_module(module_name)
         if class_name == "Leader":
             raise ImportError(f"Class '{class_name}' not found in '{module_name}'")
-        return getattr(module, class_name)
+        cls = getattr(module, class_name)
+        if not (isinstance(cls, type) and issubclass(cls, AgentFlow)):
+            raise InvalidAgentClassError(f"Class '{class_path}' is not AgentFlow")
+        _CLASS_CACHE[class_path] = cls
+        return cls
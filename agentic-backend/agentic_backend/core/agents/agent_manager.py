@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 from typing import Dict, List, Tuple, cast
 
-from agentic_backend.application_context import get_mcp_configuration
+from agentic_backend.application_context import (
+    get_app_context,
+    get_mcp_configuration,
+)
 from agentic_backend.common.structures import AgentSettings, Configuration, Leader
 from agentic_backend.core.agents.agent_flow import AgentFlow
 from agentic_backend.core.agents.agent_loader import AgentLoader
@@ -62,14 +66,23 @@ class AgentManager:
     Supports both statically declared agents (via configuration.yaml) and dynamically created ones.
     """
 
+    # One manager per process, read on every request: fixed attribute layout, no __dict__.
+    __slots__ = (
+        "config",
+        "store",
+        "loader",
+        "agent_settings",
+        "use_static_config_only",
+    )
+
     def __init__(
         self, config: Configuration, agent_loader: AgentLoader, store: BaseAgentStore
     ):
         self.config = config
         self.store = store
         self.loader = agent_loader
+        # Single registry: name -> authoritative settings (instances live in AgentFactory)
         self.agent_settings: Dict[str, AgentSettings] = {}
-        self.agent_instances: Dict[str, AgentFlow] = {}
         self.use_static_config_only = config.ai.use_static_config_only
         logger.info(
             "[AGENTS] AgentManager initialized with static_config_only=%s",
@@ -149,10 +162,11 @@ class AgentManager:
         if not tunings:
             return False
         logger.info("[AGENTS] agent=%s new_tuning=%s", name, tunings.dump())
-        # 1) Persist source of truth (DB)
+        # 1) Persist source of truth (DB), off the event loop (blocking store I/O)
+        scope = SCOPE_GLOBAL if is_global else SCOPE_USER
         try:
-            self.store.save(
-                new_settings, tunings, scope=SCOPE_GLOBAL if is_global else SCOPE_USER
+            await get_app_context().run_in_executor(
+                self.store.save, new_settings, tunings, scope
             )
         except Exception:
             logger.exception(
@@ -176,7 +190,7 @@ class AgentManager:
             return False
 
         try:
-            self.store.delete(name)
+            await get_app_context().run_in_executor(self.store.delete, name)
         except Exception:
             logger.exception(
                 "[AGENTS] agent=%s could not be deleted from persistent store.", name
@@ -199,14 +213,22 @@ class AgentManager:
 
         """
         # 1. Load and Map Data
-        static_instances = self.loader.load_static()
+        # Loading imports agent modules and reads the store: blocking work, kept off the loop.
+        # Both phases are independent (reconciliation happens below), so they run together.
+        app_context = get_app_context()
         if self.use_static_config_only:
             logger.warning(
                 "[AGENTS] 'use_static_config_only' is ENABLED. Skipping all persistent agent configuration (DB)."
             )
-            persisted_instances = []
+            static_instances = await app_context.run_in_executor(
+                self.loader.load_static
+            )
+            persisted_instances: List[AgentFlow] = []
         else:
-            persisted_instances = self.loader.load_persisted()
+            static_instances, persisted_instances = await asyncio.gather(
+                app_context.run_in_executor(self.loader.load_static),
+                app_context.run_in_executor(self.loader.load_persisted),
+            )
 
         static_catalogue: Dict[str, Tuple[AgentSettings, AgentTuning]] = {}
         persisted_state: Dict[str, Tuple[AgentSettings, AgentTuning]] = {}
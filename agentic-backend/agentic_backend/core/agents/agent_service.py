@@ -33,6 +33,10 @@ def _class_path(obj_or_type) -> str:
     return f"{t.__module__}.{t.__name__}"
 
 
+# Fixed for the process lifetime: computed once instead of on every create request
+_MCP_CLASS_PATH = _class_path(MCPAgent)
+
+
 class AgentService:
     def __init__(self, agent_manager: AgentManager):
         self.store = get_agent_store()
@@ -55,7 +59,7 @@ class AgentService:
         # Ensure class_path points to MCPAgent
         agent_settings = Agent(
             name=name,
-            class_path=_class_path(MCPAgent),
+            class_path=_MCP_CLASS_PATH,
             enabled=False,  # Start disabled until fully initialized
             tuning=MCP_TUNING,  # default tuning
             mcp_servers=[],  # Empty list by default; to be configured later
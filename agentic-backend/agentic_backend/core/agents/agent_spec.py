@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import json
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
 
@@ -60,7 +61,7 @@ class FieldSpec(BaseModel):
     max: Optional[float] = None
     pattern: Optional[str] = None
     item_type: Optional[FieldType] = None  # for arrays
-    ui: UIHints = UIHints()
+    ui: UIHints = Field(default_factory=UIHints)
 
 
 class ClientAuthMode(str, Enum):
@@ -113,7 +114,8 @@ class MCPServerRef(BaseModel):
     """
 
     name: str  # e.g., "knowledge-ops", "kubernetes"
-    require_tools: list[str] = []  # optional: "os.*", "kpi.*" capabilities
+    # optional: "os.*", "kpi.*" capabilities
+    require_tools: list[str] = Field(default_factory=list)
 
 
 class AgentTuning(BaseModel):
@@ -150,6 +152,4 @@ class AgentTuning(BaseModel):
             tuning_summary["tunable_fields_count"] = field_count
 
         # 4. Use json.dumps to format the dictionary nicely for the log file
-        import json
-
         return json.dumps(tuning_summary, indent=2)
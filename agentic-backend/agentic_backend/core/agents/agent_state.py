@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from agentic_backend.core.agents.runtime_context import (
     RuntimeContext,
@@ -14,6 +16,21 @@ from agentic_backend.core.agents.runtime_context import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent chat-context body fetches in resolve_prepared()
+_MAX_FETCH_WORKERS = 8
+
+
+def _pooled_session() -> requests.Session:
+    # Keep-alive pool sized for the fetch workers: no new TCP/TLS handshake per body
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=_MAX_FETCH_WORKERS)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+_SESSION = _pooled_session()
+
 
 @dataclass
 class Prepared:
@@ -26,28 +43,18 @@ class Prepared:
 def _split_front_matter(text: str) -> str:
     """Return body (no header). Supports both '---\\nheader\\n---\\nbody' and 'header\\n---\\nbody'."""
     s = (text or "").replace("\r\n", "\n")
-    if s.startswith("---\n"):
-        try:
-            _, body = s.split("\n---\n", 1)
-            return body
-        except ValueError:
-            return s
-    if "\n---\n" in s:
-        try:
-            _, body = s.split("\n---\n", 1)
-            return body
-        except ValueError:
-            return s
-    return s
+    # Both layouts end the header at the first "\n---\n": one scan finds and splits.
+    _, sep, body = s.partition("\n---\n")
+    return body if sep else s
 
 
 def _fetch_body(kf_base: str, rid: str, timeout: float = 8.0) -> Optional[str]:
     """Return body text for a resource id, or None if not found/invalid."""
     try:
-        resp = requests.get(f"{kf_base}/resources/{rid}", timeout=timeout)
+        resp = _SESSION.get(f"{kf_base}/resources/{rid}", timeout=timeout)
         if resp.status_code != 200:
             logger.warning(
-                f"Failed to fetch body for resource {rid}: {resp.status_code}"
+                "Failed to fetch body for resource %s: %s", rid, resp.status_code
             )
             return None
         data: Dict[str, Any] = resp.json()
@@ -69,12 +76,16 @@ def resolve_prepared(ctx: RuntimeContext, kf_base: str) -> Prepared:
     # 1) Document libraries for RAG scoping
     doc_tags = list(get_document_library_tags_ids(ctx) or [])
 
-    # 2) Prompts: loop each id, append body when resolvable; ignore failures
-    bodies: List[str] = []
-    for pid in get_chat_context_libraries_ids(ctx) or []:
-        body = _fetch_body(kf_base, pid)
-        if body:
-            bodies.append(body)
+    # 2) Prompts: fetch each id, keep bodies that resolve (in id order); ignore failures
+    prompt_ids = list(get_chat_context_libraries_ids(ctx) or [])
+    if len(prompt_ids) > 1:
+        # Independent HTTP calls: overlap their latency instead of paying it serially
+        workers = min(len(prompt_ids), _MAX_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = list(pool.map(lambda pid: _fetch_body(kf_base, pid), prompt_ids))
+    else:
+        fetched = [_fetch_body(kf_base, pid) for pid in prompt_ids]
+    bodies: List[str] = [body for body in fetched if body]
 
     prompt_profile_text = "\n\n".join(bodies) if bodies else ""
     return Prepared(doc_tag_ids=doc_tags, prompt_chat_context_text=prompt_profile_text)
@@ -21,11 +21,15 @@ def log_agent_message_summary(
     Each line shows:
         [index] role/type | content preview | tool_call_id(s)
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return  # previews are built per message: skip the walk when nothing is emitted
     if not messages:
-        logger.info(f"[AGENTS] {label}: (empty)")
+        logger.info("[AGENTS] %s: (empty)", label)
         return
 
-    logger.info(f"[AGENTS] ---- Restored history {label} messages={len(messages)} ----")
+    logger.info(
+        "[AGENTS] ---- Restored history %s messages=%d ----", label, len(messages)
+    )
     for i, msg in enumerate(messages):
         # Determine message role/type
         role = (
@@ -62,6 +66,6 @@ def log_agent_message_summary(
             if tcid:
                 extra = f" tool_call_id={tcid}"
 
-        logger.info(f"[AGENTS] [{i:02d}] {role:<10} | {preview}{extra}")
+        logger.info("[AGENTS] [%02d] %-10s | %s%s", i, role, preview, extra)
 
-    logger.info(f"[AGENTS] ---- End restored summary {label} ----")
+    logger.info("[AGENTS] ---- End restored summary %s ----", label)
@@ -2,11 +2,12 @@
 # Licensed under the Apache License, Version 2.0
 
 import logging
+from functools import lru_cache
 from typing import Any, Optional
 
 import httpx  # ← we log/inspect HTTP errors coming from MCP adapters
 from langchain_core.tools import BaseTool
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from agentic_backend.core.agents.runtime_context import (
     RuntimeContextProvider,
@@ -15,6 +16,32 @@ from agentic_backend.core.agents.runtime_context import (
 
 logger = logging.getLogger(__name__)
 
+# Max cause/context hops when looking for a wrapped httpx error (also bounds cycles)
+_MAX_UNWRAP_DEPTH = 16
+# Flattens CR/LF of an error body preview to spaces in one pass (one log line)
+_NEWLINES_TO_SPACES = bytes.maketrans(b"\n\r", b"  ")
+
+
+def _schema_property_names(args_schema: Any) -> frozenset[str]:
+    """
+    Fred rationale:
+    Names of the arguments a tool schema declares. Pydantic v2 first, v1 fallback,
+    else assume dict-like (MCP tools ship their JSON schema as a plain dict).
+    """
+    schema_method = getattr(args_schema, "model_json_schema", None)
+    if schema_method:
+        tool_schema = schema_method()
+    else:
+        schema_method = getattr(args_schema, "schema", None)
+        tool_schema = schema_method() if schema_method else args_schema
+    if isinstance(tool_schema, dict):
+        return frozenset(tool_schema.get("properties") or ())
+    return frozenset()
+
+
+# Schema classes are shared by every tool built from them: build their JSON schema once
+_class_property_names = lru_cache(maxsize=512)(_schema_property_names)
+
 
 def _unwrap_httpx_status_error(exc: BaseException) -> Optional[httpx.HTTPStatusError]:
     """
@@ -22,16 +49,16 @@ def _unwrap_httpx_status_error(exc: BaseException) -> Optional[httpx.HTTPStatusE
     MCP adapters sometimes re-wrap httpx exceptions. We walk the cause/context chain
     to find the underlying HTTPStatusError so we can extract status code & URL.
     """
-    seen: set[int] = set()
-    cur: Optional[BaseException] = exc  # type: ignore[assignment]
-    while cur and id(cur) not in seen:
-        seen.add(id(cur))
+    cur: Optional[BaseException] = exc
+    for _ in range(_MAX_UNWRAP_DEPTH):
+        if cur is None:
+            return None
         if isinstance(cur, httpx.HTTPStatusError):
             return cur
-        cur = (
-            getattr(cur, "__cause__", None)  # exception chaining
-            or getattr(cur, "__context__", None)
-        )
+        nxt = cur.__cause__ or cur.__context__  # exception chaining
+        if nxt is cur:
+            return None
+        cur = nxt
     return None
 
 
@@ -40,7 +67,12 @@ def _log_http_error(tool_name: str, err: httpx.HTTPStatusError) -> None:
     Fred rationale:
     Give ops-grade traces that directly point to auth/token problems, with enough
     context (method, URL, body snippet) to debug quickly.
+    Full tracebacks are only attached at DEBUG: status, URL and body already point
+    at the cause, and formatting the stack on every failed call is costly.
     """
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    with_trace = logger.isEnabledFor(logging.DEBUG)
     req = getattr(err, "request", None)
     resp = getattr(err, "response", None)
 
@@ -50,10 +82,13 @@ def _log_http_error(tool_name: str, err: httpx.HTTPStatusError) -> None:
 
     body_preview = ""
     try:
-        if resp is not None and resp.text:
-            txt = resp.text
-            # keep logs short; we only need a hint
-            body_preview = f" | body: {txt[:300].replace(chr(10), ' ')}"
+        raw = resp.content[:300] if resp is not None else b""
+        if raw:
+            # keep logs short; we only need a hint (decode the slice, not the body)
+            txt = raw.translate(_NEWLINES_TO_SPACES).decode(
+                resp.encoding or "utf-8", errors="replace"
+            )
+            body_preview = f" | body: {txt}"
     except Exception:
         logger.warning("Failed to extract HTTP response body", exc_info=True)
         pass
@@ -65,7 +100,7 @@ def _log_http_error(tool_name: str, err: httpx.HTTPStatusError) -> None:
             method,
             url,
             body_preview,
-            exc_info=True,
+            exc_info=with_trace,
         )
     else:
         logger.error(
@@ -75,7 +110,7 @@ def _log_http_error(tool_name: str, err: httpx.HTTPStatusError) -> None:
             method,
             url,
             body_preview,
-            exc_info=True,
+            exc_info=with_trace,
         )
 
 
@@ -96,6 +131,8 @@ class ContextAwareTool(BaseTool):
     context_provider: RuntimeContextProvider = Field(
         ..., description="Function that provides runtime context"
     )
+    # Whether the wrapped tool accepts a "tags" argument (schema read once, in __init__)
+    _supports_tags: bool = PrivateAttr(default=False)
 
     def __init__(self, base_tool: BaseTool, context_provider: RuntimeContextProvider):
         # Preserve tool identity (name/description) so LLM can pick it properly.
@@ -104,6 +141,28 @@ class ContextAwareTool(BaseTool):
             base_tool=base_tool,
             context_provider=context_provider,
         )
+        self._supports_tags = "tags" in self._tool_property_names()
+
+    def _tool_property_names(self) -> frozenset[str]:
+        """
+        Fred rationale:
+        The wrapped tool's args schema does not change after construction, so it is
+        introspected once here instead of rebuilding the JSON schema on every call.
+        """
+        args_schema = self.base_tool.args_schema
+        if not args_schema:
+            return frozenset()
+        try:
+            if isinstance(args_schema, type):
+                return _class_property_names(args_schema)
+            return _schema_property_names(args_schema)
+        except Exception as e:
+            logger.warning(
+                "ContextAwareTool(%s): could not extract tool schema: %s",
+                self.name,
+                e,
+            )
+        return frozenset()
 
     def _inject_context_if_needed(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         """
@@ -111,40 +170,16 @@ class ContextAwareTool(BaseTool):
         Keep injection conservative + schema-aware. For now we only add "tags" if the
         tool supports it and caller didn't pass it.
         """
+        # Cheap checks first: most tools take no tags, so skip the context lookup
+        if not self._supports_tags or kwargs.get("tags") is not None:
+            return kwargs
+
         context = self.context_provider()
         if not context:
             return kwargs
 
-        tool_properties = {}
-        if self.base_tool.args_schema:
-            try:
-                # Pydantic v2 first, v1 fallback, else assume dict-like
-                schema_method = getattr(
-                    self.base_tool.args_schema, "model_json_schema", None
-                )
-                if schema_method:
-                    tool_schema = schema_method()
-                else:
-                    schema_method = getattr(self.base_tool.args_schema, "schema", None)
-                    tool_schema = (
-                        schema_method() if schema_method else self.base_tool.args_schema
-                    )
-                if isinstance(tool_schema, dict):
-                    tool_properties = tool_schema.get("properties", {})
-            except Exception as e:
-                logger.warning(
-                    "ContextAwareTool(%s): could not extract tool schema: %s",
-                    self.name,
-                    e,
-                )
-                tool_properties = {}
-
         library_ids = get_document_library_tags_ids(context)
-        if (
-            library_ids
-            and "tags" in tool_properties
-            and ("tags" not in kwargs or kwargs["tags"] is None)
-        ):
+        if library_ids:
             kwargs["tags"] = library_ids
             logger.info(
                 "ContextAwareTool(%s) injecting library filter: %s",
@@ -154,27 +189,35 @@ class ContextAwareTool(BaseTool):
 
         return kwargs
 
+    def _log_tool_error(self, e: Exception) -> None:
+        """
+        Fred rationale:
+        One error-reporting path for `_run` and `_arun`. Must be called from the
+        `except` block so `logger.exception` still sees the active traceback.
+        """
+        if isinstance(e, httpx.RequestError):
+            # Network / DNS / TLS issues before we even get an HTTP status code
+            logger.error(
+                "[MCP][%s] HTTP request error: %s",
+                self.name,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            return
+        # Direct HTTPStatusError, or one wrapped by the adapters (common)
+        inner = _unwrap_httpx_status_error(e)
+        if inner is not None:
+            _log_http_error(self.name, inner)
+        else:
+            logger.exception("[MCP][%s] Tool error", self.name)
+
     def _run(self, **kwargs: Any) -> Any:
         """Sync execution with context injection + robust HTTP(401) tracing."""
         kwargs = self._inject_context_if_needed(kwargs)
         try:
             return self.base_tool._run(**kwargs)
-        except httpx.RequestError as e:
-            # Network / DNS / TLS issues before we even get an HTTP status code
-            logger.error(
-                "[MCP][%s] HTTP request error: %s", self.name, e, exc_info=True
-            )
-            raise
-        except httpx.HTTPStatusError as e:
-            _log_http_error(self.name, e)
-            raise
         except Exception as e:
-            # Catch wrapped httpx errors (common in adapters)
-            inner = _unwrap_httpx_status_error(e)
-            if inner is not None:
-                _log_http_error(self.name, inner)
-            else:
-                logger.exception("[MCP][%s] Tool error", self.name)
+            self._log_tool_error(e)
             raise
 
     async def _arun(self, config=None, **kwargs: Any) -> Any:
@@ -182,18 +225,6 @@ class ContextAwareTool(BaseTool):
         kwargs = self._inject_context_if_needed(kwargs)
         try:
             return await self.base_tool._arun(config=config, **kwargs)
-        except httpx.RequestError as e:
-            logger.error(
-                "[MCP][%s] HTTP request error: %s", self.name, e, exc_info=True
-            )
-            raise
-        except httpx.HTTPStatusError as e:
-            _log_http_error(self.name, e)
-            raise
         except Exception as e:
-            inner = _unwrap_httpx_status_error(e)
-            if inner is not None:
-                _log_http_error(self.name, inner)
-            else:
-                logger.exception("[MCP][%s] Tool error", self.name)
+            self._log_tool_error(e)
             raise
@@ -0,0 +1,101 @@
+# agentic_backend/tests/test_agent_flow_render.py
+from __future__ import annotations
+
+import pytest
+
+from agentic_backend.common.structures import Agent
+from agentic_backend.core.agents import agent_flow
+from agentic_backend.core.agents.agent_flow import AgentFlow, _template_fields
+from agentic_backend.core.agents.agent_spec import AgentTuning
+
+# -----------------------
+# tiny helpers (test-only)
+# -----------------------
+
+
+class _StubFlow(AgentFlow):
+    tuning = AgentTuning(role="test", description="test")
+
+
+def _mk_flow() -> AgentFlow:
+    return _StubFlow(Agent(name="stub"))
+
+
+class _NoSafeDict(dict):
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("render() took the _SafeDict path")
+
+
+# -----------------------
+# _template_fields
+# -----------------------
+
+
+@pytest.mark.parametrize(
+    "template, expected",
+    [
+        ("Hi {name}, today is {today}", frozenset({"name", "today"})),
+        ("{user.name} {items[0]} {user}", frozenset({"user", "items"})),
+        ("{{literal}} only", frozenset()),
+        ("", frozenset()),
+    ],
+)
+def test_template_fields_returns_root_names(template, expected):
+    assert _template_fields(template) == expected
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{0}",  # positional
+        "{}",  # auto-numbered positional
+        "{x:>{w}}",  # nested field in the format spec
+        "{name",  # malformed: unclosed brace
+        "name}",  # malformed: single closing brace
+    ],
+)
+def test_template_fields_gives_up_on_unsafe_templates(template):
+    assert _template_fields(template) is None
+
+
+# -----------------------
+# render()
+# -----------------------
+
+
+def test_render_all_fields_provided_uses_plain_dict(monkeypatch):
+    flow = _mk_flow()
+    monkeypatch.setattr(agent_flow, "_SafeDict", _NoSafeDict)
+
+    out = flow.render("  Hello {name}, today is {today}.  ", name="Ann")
+
+    assert out == f"Hello Ann, today is {flow.current_date}."
+
+
+def test_render_nested_field_with_provided_root_uses_plain_dict(monkeypatch):
+    flow = _mk_flow()
+    monkeypatch.setattr(agent_flow, "_SafeDict", _NoSafeDict)
+
+    assert flow.render("{user[name]}", user={"name": "Ann"}) == "Ann"
+
+
+def test_render_missing_field_stays_literal():
+    flow = _mk_flow()
+    assert flow.render("Hello {name} {unknown}", name="Bob") == "Hello Bob {unknown}"
+
+
+def test_render_nested_spec_keeps_safe_path():
+    flow = _mk_flow()
+    # Missing `x` is kept literal, then padded by the nested width like before
+    assert flow.render("[{x:>{w}}]", w=5) == "[  {x}]"
+
+
+@pytest.mark.parametrize("template", ["{0}", "{}", "{name", "name}"])
+def test_render_positional_and_malformed_templates_still_raise(template):
+    flow = _mk_flow()
+    with pytest.raises(ValueError):
+        flow.render(template, name="Ann")
+
+
+def test_render_none_template_is_empty():
+    assert _mk_flow().render(None) == ""  # type: ignore[arg-type]
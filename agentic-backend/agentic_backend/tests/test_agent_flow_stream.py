@@ -0,0 +1,106 @@
+# agentic_backend/tests/test_agent_flow_stream.py
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agentic_backend.common.structures import Agent
+from agentic_backend.core.agents.agent_flow import AgentFlow
+from agentic_backend.core.agents.agent_spec import AgentTuning
+
+# -----------------------
+# tiny helpers (test-only)
+# -----------------------
+
+
+class _Abort(BaseException):
+    """Stands for BaseExceptionGroup / KeyboardInterrupt without killing pytest."""
+
+
+class _FakeGraph:
+    """Mimics CompiledStateGraph.astream(): yields `events`, then ends as told."""
+
+    def __init__(self, events, *, raise_at_end=None, hang_at_end=False):
+        self.events = events
+        self.raise_at_end = raise_at_end
+        self.hang_at_end = hang_at_end
+        self.cancelled = False
+
+    async def astream(self, state, *, config=None, stream_mode=None, **kwargs):
+        for event in self.events:
+            yield event
+        if self.raise_at_end is not None:
+            raise self.raise_at_end
+        if self.hang_at_end:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+
+
+class _StubFlow(AgentFlow):
+    tuning = AgentTuning(role="test", description="test")
+
+
+def _mk_flow(graph: _FakeGraph) -> AgentFlow:
+    flow = _StubFlow(Agent(name="stub"))
+    flow.compiled_graph = graph  # type: ignore[assignment]
+    return flow
+
+
+async def _collect(flow: AgentFlow, into: list):
+    async for event in flow.astream_updates({"messages": []}):
+        into.append(event)
+
+
+def _producer_tasks():
+    return [t for t in asyncio.all_tasks() if t.get_name() == "astream[stub]"]
+
+
+# -----------------------
+# tests
+# -----------------------
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_all_updates_in_order():
+    events = [{"node": i} for i in range(20)]  # more than the prefetch bound
+    got: list = []
+    await asyncio.wait_for(_collect(_mk_flow(_FakeGraph(events)), got), timeout=5)
+    assert got == events
+    assert not _producer_tasks()
+
+
+@pytest.mark.asyncio
+async def test_graph_exception_reaches_consumer():
+    graph = _FakeGraph([{"node": 1}], raise_at_end=ValueError("boom"))
+    got: list = []
+    with pytest.raises(ValueError, match="boom"):
+        await asyncio.wait_for(_collect(_mk_flow(graph), got), timeout=5)
+    assert got == [{"node": 1}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("exc_type", [_Abort, asyncio.CancelledError])
+async def test_graph_base_exception_reaches_consumer(exc_type):
+    # Regression: a BaseException used to kill the producer silently and the
+    # consumer then waited on the queue forever.
+    graph = _FakeGraph([{"node": 1}], raise_at_end=exc_type())
+    got: list = []
+    with pytest.raises(exc_type):
+        await asyncio.wait_for(_collect(_mk_flow(graph), got), timeout=5)
+    assert got == [{"node": 1}]
+
+
+@pytest.mark.asyncio
+async def test_early_consumer_close_cancels_the_graph():
+    graph = _FakeGraph([{"node": 1}], hang_at_end=True)
+    stream = _mk_flow(graph).astream_updates({"messages": []})
+
+    assert await asyncio.wait_for(anext(stream), timeout=5) == {"node": 1}
+    await asyncio.wait_for(stream.aclose(), timeout=5)
+
+    assert graph.cancelled
+    assert all(t.done() for t in _producer_tasks())
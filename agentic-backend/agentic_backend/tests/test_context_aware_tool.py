@@ -0,0 +1,143 @@
+# agentic_backend/tests/test_context_aware_tool.py
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import pytest
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel
+
+from agentic_backend.core.agents.context_aware_tool import ContextAwareTool
+from agentic_backend.core.agents.runtime_context import RuntimeContext
+
+# -----------------------
+# tiny helpers (test-only)
+# -----------------------
+
+
+class _ArgsWithTags(BaseModel):
+    query: str
+    tags: Optional[list[str]] = None
+
+
+class _ArgsWithoutTags(BaseModel):
+    query: str
+
+
+_DICT_WITH_TAGS = {
+    "type": "object",
+    "properties": {"query": {"type": "string"}, "tags": {"type": "array"}},
+}
+_DICT_WITHOUT_TAGS = {
+    "type": "object",
+    "properties": {"query": {"type": "string"}},
+}
+
+
+class _EchoTool(BaseTool):
+    """Returns the arguments it was called with."""
+
+    name: str = "echo"
+    description: str = "Echo the call arguments."
+
+    def _run(self, **kwargs: Any) -> Any:
+        return kwargs
+
+    async def _arun(self, config=None, **kwargs: Any) -> Any:
+        return kwargs
+
+
+class _CountingProvider:
+    """RuntimeContextProvider that records how often it is asked."""
+
+    def __init__(self, context: Optional[RuntimeContext]):
+        self.context = context
+        self.calls = 0
+
+    def __call__(self) -> Optional[RuntimeContext]:
+        self.calls += 1
+        return self.context
+
+
+def _wrap(args_schema, context: Optional[RuntimeContext] = None):
+    provider = _CountingProvider(context)
+    tool = ContextAwareTool(_EchoTool(args_schema=args_schema), provider)
+    return tool, provider
+
+
+# -----------------------
+# schema introspection
+# -----------------------
+
+
+@pytest.mark.parametrize(
+    "args_schema, expected",
+    [
+        (_ArgsWithTags, True),
+        (_ArgsWithoutTags, False),
+        (_DICT_WITH_TAGS, True),
+        (_DICT_WITHOUT_TAGS, False),
+        (None, False),
+    ],
+)
+def test_supports_tags_follows_the_wrapped_schema(args_schema, expected):
+    tool, provider = _wrap(args_schema)
+    assert tool._supports_tags is expected
+    # Introspection happens at construction, without asking for a context
+    assert provider.calls == 0
+
+
+def test_tool_identity_is_preserved():
+    tool, _ = _wrap(_ArgsWithTags)
+    assert tool.name == "echo"
+    assert tool.description == "Echo the call arguments."
+
+
+# -----------------------
+# context injection
+# -----------------------
+
+
+def test_no_context_lookup_when_tags_are_unsupported():
+    context = RuntimeContext(selected_document_libraries_ids=["lib-1"])
+    tool, provider = _wrap(_ArgsWithoutTags, context)
+
+    assert tool._run(query="q") == {"query": "q"}
+    assert provider.calls == 0
+
+
+def test_no_context_lookup_when_tags_are_passed():
+    context = RuntimeContext(selected_document_libraries_ids=["lib-1"])
+    tool, provider = _wrap(_ArgsWithTags, context)
+
+    assert tool._run(query="q", tags=["mine"]) == {"query": "q", "tags": ["mine"]}
+    assert provider.calls == 0
+
+
+@pytest.mark.parametrize("args_schema", [_ArgsWithTags, _DICT_WITH_TAGS])
+def test_library_tags_are_injected_when_supported(args_schema):
+    context = RuntimeContext(selected_document_libraries_ids=["lib-1", "lib-2"])
+    tool, provider = _wrap(args_schema, context)
+
+    assert tool._run(query="q") == {"query": "q", "tags": ["lib-1", "lib-2"]}
+    assert provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_library_tags_are_injected_on_async_calls():
+    context = RuntimeContext(selected_document_libraries_ids=["lib-1"])
+    tool, provider = _wrap(_ArgsWithTags, context)
+
+    assert await tool._arun(query="q") == {"query": "q", "tags": ["lib-1"]}
+    assert provider.calls == 1
+
+
+@pytest.mark.parametrize(
+    "context",
+    [None, RuntimeContext(), RuntimeContext(selected_document_libraries_ids=[])],
+)
+def test_nothing_injected_without_selected_libraries(context):
+    tool, provider = _wrap(_ArgsWithTags, context)
+
+    assert tool._run(query="q") == {"query": "q"}
+    assert provider.calls == 1